@@ -13,6 +13,7 @@ from dex_python.deduplication import (
     find_fuzzy_name_duplicates,
     find_name_and_title_duplicates,
     find_phone_duplicates,
+    tune_connection,
 )
 
 DATA_DIR = Path(os.getenv("DEX_DATA_DIR", "output"))
@@ -59,6 +60,7 @@ def generate_report(db_path: str, output_path: str) -> None:
     Path(output_path).parent.mkdir(parents=True, exist_ok=True)
 
     conn = sqlite3.connect(db_path)
+    tune_connection(conn)
 
     print("Running Level 1 Analysis (Exact Emails/Phones)...")
     email_dupes = find_email_duplicates(conn)
@@ -142,6 +144,8 @@ def generate_report(db_path: str, output_path: str) -> None:
         for group in fuzzy_dupes:
             write_group_to_file(f, conn, group, "Fuzzy Match")
 
+    # Let SQLite refresh any stale statistics before closing
+    conn.execute("PRAGMA optimize")
     conn.close()
     print(f"Report generated: {output_path}")
 
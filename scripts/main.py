@@ -94,69 +94,91 @@ def init_db(cursor: sqlite3.Cursor) -> None:
     )
 
 
-def insert_contact_data(cursor: sqlite3.Cursor, contact: dict[str, Any]) -> None:
+# Prepared once at module scope so each batch reuses the same statements
+_INSERT_CONTACT_SQL = """
+    INSERT INTO contacts (
+        id, first_name, last_name, name_parse_type, name_parsed, name_given,
+        name_middle, name_surname, name_prefix, name_suffix, name_nickname,
+        job_title, linkedin, website, full_data
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+_INSERT_EMAIL_SQL = "INSERT INTO emails (contact_id, email) VALUES (?, ?)"
+_INSERT_PHONE_SQL = (
+    "INSERT INTO phones (contact_id, phone_number, label) VALUES (?, ?, ?)"
+)
+
+
+def insert_contacts(cursor: sqlite3.Cursor, contacts: list[dict[str, Any]]) -> None:
     """
-    Insert a single contact and its related email and phone records into the database.
-    
+    Insert a batch of contacts with their email and phone records.
+
+    Rows for each table are accumulated across the whole batch and written
+    with one executemany per table, so SQLite parses and prepares each
+    INSERT statement once per batch instead of once per row.
+
     Parameters:
-    	cursor (sqlite3.Cursor): SQLite cursor to execute insert statements.
-    	contact (dict): Contact dictionary as returned by the Dex API. Expected keys include:
-    		- "id": contact identifier (used as contacts.id and foreign key for child rows)
-    		- "first_name", "last_name"
-    		- "job_title", "linkedin", "website"
-    		- "emails": iterable of objects with an "email" field
-    		- "phones": iterable of objects with "phone_number" and optional "label" fields
-    	The original contact dict is stored in the contacts.full_data column as JSON.
+        cursor (sqlite3.Cursor): SQLite cursor to execute insert statements.
+        contacts (list[dict]): Contact dictionaries as returned by the Dex
+            API. Expected keys per contact include:
+            - "id": contact identifier (contacts.id, foreign key for child rows)
+            - "first_name", "last_name"
+            - "job_title", "linkedin", "website"
+            - "emails": iterable of objects with an "email" field
+            - "phones": iterable of objects with "phone_number" and
+              optional "label" fields
+            Each original contact dict is stored in contacts.full_data as JSON.
     """
-    c_id = contact.get("id")
+    contact_rows = []
+    email_rows = []
+    phone_rows = []
+
+    for contact in contacts:
+        c_id = contact.get("id")
+        name_fields = parse_contact_name(contact)
+        contact_rows.append(
+            (
+                c_id,
+                contact.get("first_name"),
+                contact.get("last_name"),
+                name_fields["name_parse_type"],
+                name_fields["name_parsed"],
+                name_fields["name_given"],
+                name_fields["name_middle"],
+                name_fields["name_surname"],
+                name_fields["name_prefix"],
+                name_fields["name_suffix"],
+                name_fields["name_nickname"],
+                contact.get("job_title"),
+                contact.get("linkedin"),
+                contact.get("website"),
+                json.dumps(contact),
+            )
+        )
 
-    # Insert main contact
-    name_fields = parse_contact_name(contact)
-    cursor.execute(
-        """
-        INSERT INTO contacts (
-            id, first_name, last_name, name_parse_type, name_parsed, name_given,
-            name_middle, name_surname, name_prefix, name_suffix, name_nickname,
-            job_title, linkedin, website, full_data
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """,
-        (
-            c_id,
-            contact.get("first_name"),
-            contact.get("last_name"),
-            name_fields["name_parse_type"],
-            name_fields["name_parsed"],
-            name_fields["name_given"],
-            name_fields["name_middle"],
-            name_fields["name_surname"],
-            name_fields["name_prefix"],
-            name_fields["name_suffix"],
-            name_fields["name_nickname"],
-            contact.get("job_title"),
-            contact.get("linkedin"),
-            contact.get("website"),
-            json.dumps(contact),
-        ),
-    )
+        for email_item in contact.get("emails", []):
+            email_addr = email_item.get("email")
+            if email_addr:
+                email_rows.append((c_id, email_addr))
 
-    # Insert emails
-    for email_item in contact.get("emails", []):
-        email_addr = email_item.get("email")
-        if email_addr:
-            cursor.execute(
-                "INSERT INTO emails (contact_id, email) VALUES (?, ?)",
-                (c_id, email_addr),
-            )
+        for phone_item in contact.get("phones", []):
+            phone_num = phone_item.get("phone_number")
+            if phone_num:
+                phone_rows.append((c_id, phone_num, phone_item.get("label")))
 
-    # Insert phones
-    for phone_item in contact.get("phones", []):
-        phone_num = phone_item.get("phone_number")
-        label = phone_item.get("label")
-        if phone_num:
-            cursor.execute(
-                "INSERT INTO phones (contact_id, phone_number, label) VALUES (?, ?, ?)",
-                (c_id, phone_num, label),
-            )
+    cursor.executemany(_INSERT_CONTACT_SQL, contact_rows)
+    if email_rows:
+        cursor.executemany(_INSERT_EMAIL_SQL, email_rows)
+    if phone_rows:
+        cursor.executemany(_INSERT_PHONE_SQL, phone_rows)
+
+
+def insert_contact_data(cursor: sqlite3.Cursor, contact: dict[str, Any]) -> None:
+    """
+    Insert a single contact and its related email and phone records.
+
+    Thin wrapper over insert_contacts for callers holding one contact.
+    """
+    insert_contacts(cursor, [contact])
 
 
 def main() -> None:
@@ -198,9 +220,7 @@ def main() -> None:
                 if not contacts:
                     break
 
-                for contact in contacts:
-                    insert_contact_data(cursor, contact)
-
+                insert_contacts(cursor, contacts)
                 conn.commit()
 
                 count = len(contacts)
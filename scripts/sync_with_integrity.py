@@ -573,6 +573,10 @@ async def sync_all() -> None:
             "Notes", client.get_notes_paginated, save_notes_batch, client, conn, sem
         )
 
+    # Refresh planner statistics after the bulk load so dedup queries pick
+    # the right indexes, then let SQLite tidy up before closing
+    conn.execute("ANALYZE")
+    conn.execute("PRAGMA optimize")
     conn.close()
     console.print("[bold green]All Syncs Complete![/bold green]")
 
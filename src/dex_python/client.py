@@ -21,15 +21,7 @@ from typing import Any, Self
 import httpx
 
 from .config import Settings
-from .exceptions import (
-    AuthenticationError,
-    ContactNotFoundError,
-    DexAPIError,
-    NoteNotFoundError,
-    RateLimitError,
-    ReminderNotFoundError,
-    ValidationError,
-)
+from .exceptions import handle_error_response
 from .models import (
     ContactCreate,
     ContactUpdate,
@@ -110,45 +102,7 @@ class DexClient:
             NoteNotFoundError: For 404 on /timeline_items endpoints.
             DexAPIError: For all other error responses.
         """
-        status_code = response.status_code
-        try:
-            data = response.json()
-        except Exception:
-            data = {}
-
-        if status_code == 401:
-            raise AuthenticationError(
-                "Invalid API key", status_code=401, response_data=data
-            )
-        elif status_code == 429:
-            retry_after = response.headers.get("Retry-After")
-            raise RateLimitError(
-                "Rate limit exceeded",
-                retry_after=int(retry_after) if retry_after else None,
-            )
-        elif status_code == 400:
-            raise ValidationError(
-                data.get("error", "Validation error"),
-                status_code=400,
-                response_data=data,
-            )
-        elif status_code == 404:
-            if "/contacts/" in endpoint:
-                contact_id = endpoint.split("/contacts/")[-1].split("/")[0]
-                raise ContactNotFoundError(contact_id)
-            elif "/reminders/" in endpoint:
-                reminder_id = endpoint.split("/reminders/")[-1].split("/")[0]
-                raise ReminderNotFoundError(reminder_id)
-            elif "/timeline_items/" in endpoint:
-                note_id = endpoint.split("/timeline_items/")[-1].split("/")[0]
-                raise NoteNotFoundError(note_id)
-            raise DexAPIError("Not found", status_code=404, response_data=data)
-        else:
-            raise DexAPIError(
-                data.get("error", f"API error: {status_code}"),
-                status_code=status_code,
-                response_data=data,
-            )
+        handle_error_response(response, endpoint)
 
     def _should_retry(self, status_code: int) -> bool:
         """Check if a request should be retried based on HTTP status code."""
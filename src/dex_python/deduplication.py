@@ -20,15 +20,71 @@ Example:
 """
 
 import sqlite3
-from itertools import combinations
+from collections import defaultdict
+from functools import lru_cache
+from itertools import groupby
+from operator import itemgetter
 from typing import Any
 
 import jellyfish
-import networkx as nx
+import numpy as np
+from rapidfuzz.distance import JaroWinkler
+from rapidfuzz.process import cdist
 
 from .fingerprint import fingerprint, normalize_linkedin, normalize_phone
 
 
+@lru_cache(maxsize=200_000)
+def _metaphone(name: str) -> str:
+    """Cached metaphone code for a blocking key.
+
+    Callers pass the lowercased, stripped surname so repeat surnames hit
+    the cache regardless of their original casing.
+    """
+    return jellyfish.metaphone(name)
+
+
+def tune_connection(conn: sqlite3.Connection) -> None:
+    """Apply pragmas suited to full-table dedup scans.
+
+    A large page cache plus mmap keeps the contacts/emails/phones pages
+    and their indexes resident for the whole pass instead of churning
+    through the 2 MB default cache; WAL avoids writer stalls when a merge
+    runs alongside readers.
+
+    Args:
+        conn: SQLite database connection to tune.
+    """
+    conn.execute("PRAGMA mmap_size=268435456")  # 256 MB
+    conn.execute("PRAGMA cache_size=-262144")  # 256 MB
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+
+
+def _ensure_contacts_norm(conn: sqlite3.Connection) -> None:
+    """Create the contacts_norm shadow table if this connection lacks it.
+
+    Normalizes first/last names once per connection so every matcher can
+    read the precomputed ``fn``/``ln`` columns instead of re-running its
+    own LOWER(TRIM()) pass over contacts. The table is TEMP, so it never
+    outlives the connection; callers that mutate contacts mid-run should
+    drop temp.contacts_norm to force a rebuild.
+    """
+    cursor = conn.cursor()
+    cursor.execute(
+        "SELECT 1 FROM sqlite_temp_master WHERE type='table' AND name='contacts_norm'"
+    )
+    if cursor.fetchone() is None:
+        cursor.execute("""
+            CREATE TEMP TABLE contacts_norm AS
+            SELECT
+                id,
+                LOWER(TRIM(first_name)) AS fn,
+                LOWER(TRIM(last_name)) AS ln
+            FROM contacts
+        """)
+
+
 def find_email_duplicates(conn: sqlite3.Connection) -> list[dict[str, Any]]:
     """Find groups of contacts sharing the same email address.
 
@@ -43,12 +99,17 @@ def find_email_duplicates(conn: sqlite3.Connection) -> list[dict[str, Any]]:
     """
     cursor = conn.cursor()
 
+    # Inner DISTINCT dedupes (email, contact) pairs up front so the outer
+    # aggregate streams without a per-group COUNT(DISTINCT) temp b-tree
     query = """
-        SELECT lower(email) as norm_email, GROUP_CONCAT(DISTINCT contact_id) as ids
-        FROM emails
-        WHERE email IS NOT NULL AND email != ''
-        GROUP BY lower(email)
-        HAVING COUNT(DISTINCT contact_id) > 1
+        SELECT norm_email, GROUP_CONCAT(contact_id) as ids
+        FROM (
+            SELECT DISTINCT lower(email) as norm_email, contact_id
+            FROM emails
+            WHERE email IS NOT NULL AND email != ''
+        )
+        GROUP BY norm_email
+        HAVING COUNT(*) > 1
     """
 
     cursor.execute(query)
@@ -57,7 +118,7 @@ def find_email_duplicates(conn: sqlite3.Connection) -> list[dict[str, Any]]:
         {
             "match_type": "email",
             "match_value": email,
-            "contact_ids": ids_str.split(","),
+            "contact_ids": frozenset(ids_str.split(",")),
         }
         for email, ids_str in cursor.fetchall()
     ]
@@ -78,42 +139,31 @@ def find_phone_duplicates(conn: sqlite3.Connection) -> list[dict[str, Any]]:
         'match_type' set to 'phone', 'match_value' containing the normalized phone
         string, and 'contact_ids' containing a list of contact IDs that share that number.
     """
+    # Expose the Python normalizer to SQLite so grouping happens in a
+    # single SQL pass instead of pulling every row into Python.
+    conn.create_function("norm_phone", 1, normalize_phone, deterministic=True)
     cursor = conn.cursor()
 
-    # Fetch all phones with their contact IDs
     query = """
-        SELECT contact_id, phone_number
-        FROM phones
-        WHERE phone_number IS NOT NULL AND phone_number != ''
+        SELECT norm, GROUP_CONCAT(contact_id) as ids
+        FROM (
+            SELECT DISTINCT norm_phone(phone_number) as norm, contact_id
+            FROM phones
+            WHERE phone_number IS NOT NULL AND phone_number != ''
+        )
+        GROUP BY norm
+        HAVING norm != '' AND COUNT(*) > 1
     """
-    cursor.execute(query)
-    rows = cursor.fetchall()
-
-    # Group by normalized phone number
-    phone_groups: dict[str, set[str]] = {}
-    phone_originals: dict[str, str] = {}
-
-    for contact_id, phone_number in rows:
-        normalized = normalize_phone(phone_number)
-        if not normalized:
-            continue
-
-        if normalized not in phone_groups:
-            phone_groups[normalized] = set()
-            phone_originals[normalized] = phone_number
-        phone_groups[normalized].add(contact_id)
 
-    # Find groups with multiple contacts
-    results = []
-    for normalized, contact_ids in phone_groups.items():
-        if len(contact_ids) > 1:
-            results.append(
-                {
-                    "match_type": "phone",
-                    "match_value": normalized,
-                    "contact_ids": list(contact_ids),
-                }
-            )
+    cursor.execute(query)
+    results = [
+        {
+            "match_type": "phone",
+            "match_value": norm,
+            "contact_ids": frozenset(ids_str.split(",")),
+        }
+        for norm, ids_str in cursor.fetchall()
+    ]
     return results
 
 
@@ -132,39 +182,34 @@ def find_linkedin_duplicates(conn: sqlite3.Connection) -> list[dict[str, Any]]:
         List of match dictionaries with 'match_type', 'match_value',
         and 'contact_ids' keys.
     """
+    # Register the Python normalizer with SQLite so grouping runs as a
+    # single SQL aggregation, mirroring the phone detector. A stored
+    # generated column was considered but rejected: generated columns are
+    # limited to built-in functions, which cannot reproduce
+    # normalize_linkedin's username/company/locale handling.
+    conn.create_function(
+        "norm_linkedin", 1, normalize_linkedin, deterministic=True
+    )
     cursor = conn.cursor()
 
     query = """
-        SELECT id, linkedin
+        SELECT norm_linkedin(linkedin) as norm,
+               GROUP_CONCAT(DISTINCT id) as ids
         FROM contacts
         WHERE linkedin IS NOT NULL AND linkedin != ''
+        GROUP BY norm
+        HAVING norm != '' AND COUNT(DISTINCT id) > 1
     """
-    cursor.execute(query)
-    rows = cursor.fetchall()
-
-    # Group by normalized LinkedIn URL
-    linkedin_groups: dict[str, set[str]] = {}
 
-    for contact_id, linkedin in rows:
-        normalized = normalize_linkedin(linkedin)
-        if not normalized:
-            continue
-
-        if normalized not in linkedin_groups:
-            linkedin_groups[normalized] = set()
-        linkedin_groups[normalized].add(contact_id)
-
-    # Find groups with multiple contacts
-    results = []
-    for normalized, contact_ids in linkedin_groups.items():
-        if len(contact_ids) > 1:
-            results.append(
-                {
-                    "match_type": "linkedin",
-                    "match_value": normalized,
-                    "contact_ids": list(contact_ids),
-                }
-            )
+    cursor.execute(query)
+    results = [
+        {
+            "match_type": "linkedin",
+            "match_value": norm,
+            "contact_ids": frozenset(ids_str.split(",")),
+        }
+        for norm, ids_str in cursor.fetchall()
+    ]
     return results
 
 
@@ -180,21 +225,23 @@ def find_birthday_name_duplicates(conn: sqlite3.Connection) -> list[dict[str, An
             - 'match_value': a human-readable string "{full_name} (birthday: {MM-DD})"
             - 'contact_ids': list of contact id strings that belong to the match
     """
+    _ensure_contacts_norm(conn)
     cursor = conn.cursor()
 
     query = """
         SELECT
-            lower(trim(first_name)) || ' ' || lower(trim(last_name)) as full_name,
-            substr(json_extract(full_data, '$.birthday'), 6) as month_day,
-            GROUP_CONCAT(DISTINCT id) as ids
-        FROM contacts
+            cn.fn || ' ' || cn.ln as full_name,
+            substr(json_extract(c.full_data, '$.birthday'), 6) as month_day,
+            GROUP_CONCAT(DISTINCT c.id) as ids
+        FROM contacts c
+        JOIN contacts_norm cn ON cn.id = c.id
         WHERE
-            json_extract(full_data, '$.birthday') IS NOT NULL
-            AND json_extract(full_data, '$.birthday') NOT LIKE '2001-01-01%'
-            AND first_name IS NOT NULL AND first_name != ''
-            AND last_name IS NOT NULL AND last_name != ''
-        GROUP BY lower(trim(first_name)), lower(trim(last_name)), month_day
-        HAVING COUNT(DISTINCT id) > 1
+            json_extract(c.full_data, '$.birthday') IS NOT NULL
+            AND json_extract(c.full_data, '$.birthday') NOT LIKE '2001-01-01%'
+            AND cn.fn IS NOT NULL AND cn.fn != ''
+            AND cn.ln IS NOT NULL AND cn.ln != ''
+        GROUP BY cn.fn, cn.ln, month_day
+        HAVING COUNT(DISTINCT c.id) > 1
     """
 
     cursor.execute(query)
@@ -203,7 +250,7 @@ def find_birthday_name_duplicates(conn: sqlite3.Connection) -> list[dict[str, An
         {
             "match_type": "birthday_name",
             "match_value": f"{full_name} (birthday: {month_day})",
-            "contact_ids": ids_str.split(","),
+            "contact_ids": frozenset(ids_str.split(",")),
         }
         for full_name, month_day, ids_str in cursor.fetchall()
     ]
@@ -236,26 +283,23 @@ def find_fingerprint_name_duplicates(
           AND last_name IS NOT NULL AND last_name != ''
     """
     cursor.execute(query)
-    rows = cursor.fetchall()
 
-    # Group by fingerprint
-    fp_groups: dict[str, list[tuple[str, str]]] = {}
+    # Single pass: bucket each contact by fingerprint (blocking), so no
+    # pairwise comparisons are needed.
+    fp_groups: dict[str, list[tuple[str, str]]] = defaultdict(list)
 
-    for contact_id, first_name, last_name in rows:
+    for contact_id, first_name, last_name in cursor:
         full_name = f"{first_name} {last_name}"
         fp = fingerprint(full_name)
         if not fp:
             continue
-
-        if fp not in fp_groups:
-            fp_groups[fp] = []
         fp_groups[fp].append((contact_id, full_name))
 
     # Find groups with multiple contacts
     results = []
     for fp, contacts in fp_groups.items():
         if len(contacts) > 1:
-            contact_ids = [c[0] for c in contacts]
+            contact_ids = frozenset(c[0] for c in contacts)
             names = [c[1] for c in contacts]
             results.append(
                 {
@@ -280,20 +324,22 @@ def find_name_and_title_duplicates(conn: sqlite3.Connection) -> list[dict[str, A
         List of match dictionaries with 'match_type', 'match_value',
         and 'contact_ids' keys.
     """
+    _ensure_contacts_norm(conn)
     cursor = conn.cursor()
 
     query = """
         SELECT
-            lower(trim(first_name)) || ' ' || lower(trim(last_name)) as full_name,
-            lower(trim(job_title)) as title,
-            GROUP_CONCAT(id) as ids
-        FROM contacts
+            cn.fn || ' ' || cn.ln as full_name,
+            lower(trim(c.job_title)) as title,
+            GROUP_CONCAT(c.id) as ids
+        FROM contacts c
+        JOIN contacts_norm cn ON cn.id = c.id
         WHERE
-            first_name IS NOT NULL AND first_name != '' AND
-            last_name IS NOT NULL AND last_name != '' AND
-            job_title IS NOT NULL AND job_title != ''
-        GROUP BY lower(trim(first_name)), lower(trim(last_name)), lower(trim(job_title))
-        HAVING COUNT(DISTINCT id) > 1
+            cn.fn IS NOT NULL AND cn.fn != '' AND
+            cn.ln IS NOT NULL AND cn.ln != '' AND
+            c.job_title IS NOT NULL AND c.job_title != ''
+        GROUP BY cn.fn, cn.ln, lower(trim(c.job_title))
+        HAVING COUNT(DISTINCT c.id) > 1
     """
 
     cursor.execute(query)
@@ -302,7 +348,7 @@ def find_name_and_title_duplicates(conn: sqlite3.Connection) -> list[dict[str, A
         {
             "match_type": "name_title",
             "match_value": f"{full_name} | {title}",
-            "contact_ids": ids_str.split(","),
+            "contact_ids": frozenset(ids_str.split(",")),
         }
         for full_name, title, ids_str in cursor.fetchall()
     ]
@@ -344,7 +390,7 @@ def find_fuzzy_name_duplicates(
             continue
 
         try:
-            key = jellyfish.metaphone(last) or last.lower()[:2]
+            key = _metaphone(last.lower()) or last.lower()[:2]
         except Exception:
             key = last.lower()[:2]
 
@@ -352,26 +398,51 @@ def find_fuzzy_name_duplicates(
             blocks[key] = []
         blocks[key].append({"id": rid, "full_name": f"{first} {last}"})
 
+    # Blocks are independent, but cdist already fans each block's scoring
+    # out across all cores (workers=-1), so a process pool here would only
+    # add pickling and fork overhead on top of saturated CPUs.
     results = []
     for items in blocks.values():
-        if len(items) < 2:
-            continue
-        for i in range(len(items)):
-            for j in range(i + 1, len(items)):
-                p1, p2 = items[i], items[j]
-                score = jellyfish.jaro_winkler_similarity(
-                    p1["full_name"], p2["full_name"]
-                )
-                if score >= threshold:
-                    results.append(
-                        {
-                            "match_type": "fuzzy_name",
-                            "match_value": (
-                                f"{p1['full_name']} <-> {p2['full_name']} ({score:.2f})"
-                            ),
-                            "contact_ids": [p1["id"], p2["id"]],
-                        }
-                    )
+        results.extend(_find_matches_in_block(items, threshold))
+    return results
+
+
+def _find_matches_in_block(
+    items: list[dict[str, str]], threshold: float
+) -> list[dict[str, Any]]:
+    """Score all name pairs within one blocking group.
+
+    Top-level (picklable) so callers can also distribute blocks across
+    processes if a workload ever warrants it.
+    """
+    if len(items) < 2:
+        return []
+
+    names = [item["full_name"] for item in items]
+    # Score all pairs in the block with vectorized C code rather than
+    # a Python double loop over jellyfish calls
+    scores = cdist(
+        names,
+        names,
+        scorer=JaroWinkler.normalized_similarity,
+        score_cutoff=threshold,
+        dtype=np.float32,
+        workers=-1,
+    )
+
+    results = []
+    for i, j in np.argwhere(np.triu(scores >= threshold, k=1)):
+        p1, p2 = items[i], items[j]
+        score = float(scores[i, j])
+        results.append(
+            {
+                "match_type": "fuzzy_name",
+                "match_value": (
+                    f"{p1['full_name']} <-> {p2['full_name']} ({score:.2f})"
+                ),
+                "contact_ids": frozenset((p1["id"], p2["id"])),
+            }
+        )
     return results
 
 
@@ -381,20 +452,93 @@ def cluster_duplicates(matches: list[dict[str, Any]]) -> list[list[str]]:
     If A matches B and B matches C, they all end up in the same cluster
     even if A and C never matched directly.
 
+    Uses union-find with path compression, so each match is processed in
+    near-constant amortized time.
+
     Args:
         matches: List of match dictionaries with 'contact_ids' key.
 
     Returns:
         List of clusters, where each cluster is a list of contact IDs.
     """
-    graph: nx.Graph[str] = nx.Graph()
-    # Optimize: batch add edges instead of nested loops
+    parent: dict[str, str] = {}
+
+    def find(x: str) -> str:
+        """Find the root of x, compressing the path along the way."""
+        root = x
+        while parent[root] != root:
+            root = parent[root]
+        while parent[x] != root:
+            parent[x], x = root, parent[x]
+        return root
+
     for match in matches:
         ids = match["contact_ids"]
-        if len(ids) >= 2:
-            # Add edges efficiently using itertools.combinations
-            graph.add_edges_from(combinations(ids, 2))
-    return [list(c) for c in nx.connected_components(graph)]
+        if len(ids) < 2:
+            continue
+        for cid in ids:
+            parent.setdefault(cid, cid)
+        # Union every ID in the match with an arbitrary anchor member
+        # (contact_ids may be any iterable, including a frozenset)
+        ids_iter = iter(ids)
+        anchor = find(next(ids_iter))
+        for cid in ids_iter:
+            parent[find(cid)] = anchor
+
+    # Emit clusters by sorting (root, id) pairs and grouping on the root:
+    # one contiguous list instead of incremental per-root dict/list growth
+    pairs = sorted((find(cid), cid) for cid in parent)
+    return [
+        [cid for _, cid in group]
+        for _, group in groupby(pairs, key=itemgetter(0))
+    ]
+
+
+def _select_primary_row(rows: list[tuple[Any, ...]]) -> list[tuple[Any, ...]]:
+    """Order candidate rows by completeness, most complete first.
+
+    Counts non-empty fields per row in a NumPy matrix and stable-sorts
+    descending, so ties keep their database order. The first row is the
+    best primary; the rest are merged into it.
+    """
+    non_empty = np.array(
+        [[field is not None and field != "" for field in row] for row in rows],
+        dtype=np.int8,
+    )
+    order = np.argsort(-non_empty.sum(axis=1), kind="stable")
+    return [rows[i] for i in order]
+
+
+def _consolidate_related_records(
+    cursor: sqlite3.Cursor,
+    primary_id: str,
+    contact_ids: list[str],
+    placeholders: str,
+) -> None:
+    """Reassign related emails/phones to the primary contact and dedupe.
+
+    Issues one UPDATE per related table followed by one DELETE that keeps
+    the first row per (contact_id, value) group. Runs inside the caller's
+    transaction; the caller is responsible for committing.
+    """
+    cursor.execute(
+        f"UPDATE emails SET contact_id = ? WHERE contact_id IN ({placeholders})",
+        [primary_id] + contact_ids,
+    )
+    cursor.execute(
+        f"UPDATE phones SET contact_id = ? WHERE contact_id IN ({placeholders})",
+        [primary_id] + contact_ids,
+    )
+    cursor.execute("""
+        DELETE FROM emails WHERE id NOT IN (
+            SELECT MIN(id) FROM emails GROUP BY contact_id, lower(email)
+        )
+    """)
+    cursor.execute("""
+        DELETE FROM phones WHERE id NOT IN (
+            SELECT MIN(id) FROM phones GROUP BY contact_id, phone_number
+        )
+    """)
 
 
 def merge_cluster(
@@ -441,21 +585,8 @@ def merge_cluster(
         other_rows = [r for r in rows if r[0] != primary_id]
         sorted_rows = [primary_row] + other_rows
     else:
-        # Auto-select best primary
-        def score_row(row: tuple[Any, ...]) -> int:
-            """
-            Compute a completeness score for a database row by counting fields that contain a value.
-            
-            Parameters:
-                row (tuple[Any, ...]): Sequence of fields from a contact record.
-            
-            Returns:
-                int: Number of fields that are neither `None` nor the empty string.
-            """
-            return sum(1 for field in row if field is not None and field != "")
-
         # Prefer the most complete record to minimize data loss when merging.
-        sorted_rows = sorted(rows, key=score_row, reverse=True)
+        sorted_rows = _select_primary_row(rows)
         primary_row = sorted_rows[0]
         primary_id = primary_row[0]
 
@@ -483,23 +614,7 @@ def merge_cluster(
         ),
     )
 
-    for table in ["emails", "phones"]:
-        cursor.execute(
-            f"UPDATE {table} SET contact_id = ? WHERE contact_id IN ({placeholders})",
-            [primary_id] + contact_ids,
-        )
-        if table == "emails":
-            cursor.execute("""
-                DELETE FROM emails WHERE id NOT IN (
-                    SELECT MIN(id) FROM emails GROUP BY contact_id, lower(email)
-                )
-            """)
-        else:
-            cursor.execute("""
-                DELETE FROM phones WHERE id NOT IN (
-                    SELECT MIN(id) FROM phones GROUP BY contact_id, phone_number
-                )
-            """)
+    _consolidate_related_records(cursor, primary_id, contact_ids, placeholders)
 
     cursor.execute(
         f"DELETE FROM contacts WHERE id IN ({placeholders}) AND id != ?",
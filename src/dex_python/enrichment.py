@@ -12,6 +12,10 @@ Example:
 
 import re
 
+# Matches " at " or " @ " (case-insensitive); compiled once at import
+# since parse_job_title runs per contact during bulk enrichment
+_JOB_TITLE_SEPARATOR_RE = re.compile(r"\s+(?:at|@)\s+", re.IGNORECASE)
+
 
 def parse_job_title(job_title: str | None) -> dict[str, str | None]:
     """Parse job title to extract role and company.
@@ -34,9 +38,7 @@ def parse_job_title(job_title: str | None) -> dict[str, str | None]:
     if not job_title:
         return {"role": "", "company": None}
 
-    # Pattern matches " at " or " @ " (case-insensitive)
-    pattern = r"\s+(?:at|@)\s+"
-    match = re.split(pattern, job_title, maxsplit=1, flags=re.IGNORECASE)
+    match = _JOB_TITLE_SEPARATOR_RE.split(job_title, maxsplit=1)
 
     if len(match) == 2:
         role = match[0].strip()
@@ -21,7 +21,10 @@ Example:
     ...     print(f"Rate limited, retry after {e.retry_after}s")
 """
 
-from typing import Any
+import re
+from typing import Any, Callable, NoReturn
+
+import httpx
 
 
 class DexAPIError(Exception):
@@ -155,3 +158,99 @@ class ValidationError(DexAPIError):
     """
 
     pass
+
+
+def _raise_authentication_error(
+    response: httpx.Response, endpoint: str, data: dict[str, Any]
+) -> NoReturn:
+    raise AuthenticationError("Invalid API key", status_code=401, response_data=data)
+
+
+def _raise_rate_limit_error(
+    response: httpx.Response, endpoint: str, data: dict[str, Any]
+) -> NoReturn:
+    retry_after = response.headers.get("Retry-After")
+    raise RateLimitError(
+        "Rate limit exceeded",
+        retry_after=int(retry_after) if retry_after else None,
+    )
+
+
+def _raise_validation_error(
+    response: httpx.Response, endpoint: str, data: dict[str, Any]
+) -> NoReturn:
+    raise ValidationError(
+        data.get("error", "Validation error"),
+        status_code=400,
+        response_data=data,
+    )
+
+
+# Checked in order; /contacts/ must stay first so nested endpoints like
+# /timeline_items/contacts/{id} keep resolving the way they always have
+_NOT_FOUND_PATTERNS: tuple[tuple[re.Pattern[str], type[DexAPIError]], ...] = (
+    (re.compile(r"/contacts/([^/?#]+)"), ContactNotFoundError),
+    (re.compile(r"/reminders/([^/?#]+)"), ReminderNotFoundError),
+    (re.compile(r"/timeline_items/([^/?#]+)"), NoteNotFoundError),
+)
+
+
+def _raise_not_found_error(
+    response: httpx.Response, endpoint: str, data: dict[str, Any]
+) -> NoReturn:
+    for pattern, error_class in _NOT_FOUND_PATTERNS:
+        match = pattern.search(endpoint)
+        if match:
+            raise error_class(match.group(1))
+    raise DexAPIError("Not found", status_code=404, response_data=data)
+
+
+def _raise_api_error(
+    response: httpx.Response, endpoint: str, data: dict[str, Any]
+) -> NoReturn:
+    raise DexAPIError(
+        data.get("error", f"API error: {response.status_code}"),
+        status_code=response.status_code,
+        response_data=data,
+    )
+
+
+# Status-code dispatch table: one hash lookup instead of a comparison
+# chain on a path hit for every failed request during bulk imports
+_ERROR_HANDLERS: dict[
+    int, Callable[[httpx.Response, str, dict[str, Any]], NoReturn]
+] = {
+    401: _raise_authentication_error,
+    429: _raise_rate_limit_error,
+    400: _raise_validation_error,
+    404: _raise_not_found_error,
+}
+
+
+def handle_error_response(response: httpx.Response, endpoint: str) -> NoReturn:
+    """Convert an HTTP error response to the appropriate exception.
+
+    Shared by DexClient and AsyncDexClient so the status-to-exception
+    mapping lives in one place.
+
+    Args:
+        response: The HTTP response with error status.
+        endpoint: The API endpoint that was called.
+
+    Raises:
+        AuthenticationError: For 401 responses.
+        RateLimitError: For 429 responses.
+        ValidationError: For 400 responses.
+        ContactNotFoundError: For 404 on /contacts endpoints.
+        ReminderNotFoundError: For 404 on /reminders endpoints.
+        NoteNotFoundError: For 404 on /timeline_items endpoints.
+        DexAPIError: For all other error responses.
+    """
+    try:
+        data = response.json()
+    except Exception:
+        data = {}
+
+    _ERROR_HANDLERS.get(response.status_code, _raise_api_error)(
+        response, endpoint, data
+    )
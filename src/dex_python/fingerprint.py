@@ -15,16 +15,53 @@ Example:
 
 import re
 import string
+import sys
+from collections.abc import Sequence
+from functools import lru_cache
 
-import jellyfish
+import numpy as np
 import phonenumbers
 from phonenumbers import NumberParseException, PhoneNumberFormat
+from rapidfuzz.distance import JaroWinkler, Levenshtein
+from rapidfuzz.process import cdist
 from unidecode import unidecode
 
+# Compiled once at import; normalize_phone runs per contact row. The
+# explicit ASCII class avoids the Unicode digit tables that \D consults.
+_NON_DIGIT_RE = re.compile(r"[^0-9]")
 
+# Deletes the usual phone formatting characters in one C-level pass;
+# anything rarer falls back to the regex below
+_PHONE_FORMAT_TABLE = str.maketrans("", "", "()-. /+")
+
+# Punctuation-deletion table built once at import; str.translate runs in C
+# and the keying functions are called per contact during dedup
+_PUNCT_TABLE = str.maketrans("", "", string.punctuation)
+
+# unidecode walks strings character by character in Python; for the
+# Latin-1 range, which covers nearly all accented Western names, a
+# 256-entry table precomputed from unidecode itself folds to ASCII in
+# one C-level translate with identical output
+_LATIN1_FOLD = {i: unidecode(chr(i)) for i in range(0x80, 0x100)}
+
+
+def _fold_to_ascii(value: str) -> str:
+    """Transliterate to ASCII, fast-pathing ASCII and Latin-1 input."""
+    if value.isascii():
+        return value
+    value = value.translate(_LATIN1_FOLD)
+    if value.isascii():
+        return value
+    return unidecode(value)
+
+
+@lru_cache(maxsize=65536)
 def fingerprint(value: str | None) -> str:
     """Create OpenRefine-style fingerprint for clustering.
 
+    Results are memoized: dedup workloads fingerprint the same names
+    repeatedly, so repeat calls skip the normalization pipeline.
+
     Performs these operations in order:
     1. Strip leading/trailing whitespace
     2. Convert to lowercase
@@ -56,22 +93,25 @@ def fingerprint(value: str | None) -> str:
         return ""
 
     # Normalize unicode to ASCII (José -> Jose)
-    value = unidecode(value)
+    value = _fold_to_ascii(value)
 
     # Remove punctuation
-    value = value.translate(str.maketrans("", "", string.punctuation))
-
-    # Split into tokens, sort, dedupe, rejoin
-    tokens = value.split()
-    unique_tokens = list(dict.fromkeys(tokens))  # Preserve first occurrence, dedupe
-    unique_tokens.sort()
+    value = value.translate(_PUNCT_TABLE)
 
-    return " ".join(unique_tokens)
+    # Split into tokens, dedupe, sort, rejoin; the set drops duplicates
+    # directly since sorting erases insertion order anyway. Interning the
+    # key collapses equal fingerprints from different raw inputs
+    # ("Tom Cruise" / "Cruise, Tom") into one shared string, so dedup
+    # indexes compare keys by pointer and hold one copy per cluster.
+    return sys.intern(" ".join(sorted(set(value.split()))))
 
 
+@lru_cache(maxsize=65536)
 def ngram_fingerprint(value: str | None, n: int = 2) -> str:
     """Create n-gram fingerprint for fuzzy matching.
 
+    Results are memoized per (value, n), like :func:`fingerprint`.
+
     Performs these operations:
     1. Convert to lowercase
     2. Remove all whitespace
@@ -102,19 +142,21 @@ def ngram_fingerprint(value: str | None, n: int = 2) -> str:
         return ""
 
     # Normalize unicode and remove punctuation
-    value = unidecode(value)
-    value = value.translate(str.maketrans("", "", string.punctuation))
+    value = _fold_to_ascii(value)
+    value = value.translate(_PUNCT_TABLE)
 
     if len(value) < n:
         return value
 
+    # 1-grams are just the character set; skip the slicing loop
+    if n == 1:
+        return "".join(sorted(set(value)))
+
     # Extract n-grams
     ngrams = [value[i : i + n] for i in range(len(value) - n + 1)]
 
     # Sort and dedupe
-    unique_ngrams = sorted(set(ngrams))
-
-    return "".join(unique_ngrams)
+    return "".join(sorted(set(ngrams)))
 
 
 def normalize_phone(phone: str | None) -> str:
@@ -140,10 +182,14 @@ def normalize_phone(phone: str | None) -> str:
         return ""
 
     # Remove +1 country code prefix
-    phone = re.sub(r"^\+1\s*", "", phone)
+    if phone.startswith("+1"):
+        phone = phone[2:]
 
-    # Extract digits only
-    digits = re.sub(r"\D", "", phone)
+    # Extract digits only; the translate fast path covers the common
+    # formatting characters without invoking the regex engine
+    digits = phone.translate(_PHONE_FORMAT_TABLE)
+    if not digits.isdigit():
+        digits = _NON_DIGIT_RE.sub("", digits)
 
     return digits
 
@@ -170,12 +216,9 @@ def normalized_levenshtein(s1: str, s2: str) -> float:
     if not s1 and not s2:
         return 0.0
 
-    max_len = max(len(s1), len(s2))
-    if max_len == 0:
-        return 0.0
-
-    distance = jellyfish.levenshtein_distance(s1, s2)
-    return distance / max_len
+    # rapidfuzz's bit-parallel C++ implementation; normalizes by the
+    # longer string, matching the previous jellyfish-based division
+    return Levenshtein.normalized_distance(s1, s2)
 
 
 def ensemble_similarity(
@@ -203,7 +246,7 @@ def ensemble_similarity(
         0.95...
     """
     # Jaro-Winkler returns similarity (0-1)
-    jw_score = jellyfish.jaro_winkler_similarity(s1, s2)
+    jw_score = JaroWinkler.normalized_similarity(s1, s2)
 
     # Convert Levenshtein distance to similarity
     lev_distance = normalized_levenshtein(s1, s2)
@@ -213,6 +256,53 @@ def ensemble_similarity(
     return (jw_weight * jw_score) + (lev_weight * lev_score)
 
 
+def ensemble_similarity_matrix(
+    queries: Sequence[str],
+    choices: Sequence[str],
+    jw_weight: float = 0.6,
+    lev_weight: float = 0.4,
+) -> np.ndarray:
+    """Calculate ensemble similarity for every query/choice pair at once.
+
+    Batched counterpart to :func:`ensemble_similarity` for dedup
+    workloads comparing N contacts against M candidates: both scorers
+    run through rapidfuzz's cdist, which releases the GIL and spreads
+    the comparisons across cores, and the weighting is applied with
+    NumPy instead of per-pair Python calls.
+
+    Args:
+        queries: First batch of strings (rows of the result).
+        choices: Second batch of strings (columns of the result).
+        jw_weight: Weight for Jaro-Winkler scores (default: 0.6).
+        lev_weight: Weight for Levenshtein scores (default: 0.4).
+
+    Returns:
+        float32 matrix of shape (len(queries), len(choices)) with
+        combined similarity scores from 0.0 to 1.0.
+
+    Example:
+        >>> ensemble_similarity_matrix(["Jonathan"], ["Jonathon"]).shape
+        (1, 1)
+    """
+    jw_scores = cdist(
+        queries,
+        choices,
+        scorer=JaroWinkler.normalized_similarity,
+        dtype=np.float32,
+        workers=-1,
+    )
+    lev_scores = cdist(
+        queries,
+        choices,
+        scorer=Levenshtein.normalized_similarity,
+        dtype=np.float32,
+        workers=-1,
+    )
+    result: np.ndarray = jw_weight * jw_scores + lev_weight * lev_scores
+    return result
+
+
+@lru_cache(maxsize=65536)
 def normalize_phone_e164(
     phone: str | None,
     default_region: str = "US",
@@ -220,7 +310,9 @@ def normalize_phone_e164(
 ) -> str:
     """Normalize phone number to E.164 international format.
 
-    Uses Google's libphonenumber for parsing and validation.
+    Uses Google's libphonenumber for parsing and validation. Parsing is
+    the costliest normalizer in this module, so results are memoized per
+    (phone, default_region, strict).
 
     Args:
         phone: Phone number string in any format.
@@ -246,6 +338,21 @@ def normalize_phone_e164(
     if not phone:
         return ""
 
+    # Fast path for the common US case: a plain 10-digit NANP number
+    # (optionally prefixed with 1) formats to +1<digits> without the
+    # full libphonenumber parse. Strict mode still validates properly.
+    if not strict and default_region == "US":
+        # A "+" prefix must be the NANP country code, otherwise the
+        # number belongs to another region and needs the full parse.
+        national = phone[2:] if phone.startswith("+1") else phone
+        if "+" not in national:
+            digits = national.translate(_PHONE_FORMAT_TABLE)
+            if digits.isdigit():
+                if len(digits) == 11 and digits[0] == "1":
+                    digits = digits[1:]
+                if len(digits) == 10 and digits[0] not in "01":
+                    return "+1" + digits
+
     try:
         parsed = phonenumbers.parse(phone, default_region)
 
@@ -297,16 +404,30 @@ def format_phone(
         return phone  # Return original if unparseable
 
 
-# LinkedIn URL pattern - matches various URL formats
-_LINKEDIN_PROFILE_RE = re.compile(
-    r"^(?:https?://)?(?:www\.|[a-z]{2}\.)?(?:m\.)?linkedin\.com/(in|company)/([^/?#]+)",
-    re.IGNORECASE,
-)
-
+def _is_linkedin_host(host: str) -> bool:
+    """Check a lowercased host prefix like ``www.`` or ``uk.m.``.
 
+    Accepts the empty string, ``www.`` or a two-letter locale subdomain,
+    optionally followed by ``m.`` — the shapes LinkedIn actually serves.
+    """
+    if host.startswith("www."):
+        host = host[4:]
+    elif len(host) >= 3 and host[2] == ".":
+        locale = host[:2]
+        if not (locale.isascii() and locale.isalpha()):
+            return False
+        host = host[3:]
+    if host.startswith("m."):
+        host = host[2:]
+    return host == ""
+
+
+@lru_cache(maxsize=65536)
 def normalize_linkedin(url: str | None) -> str:
     """Normalize LinkedIn URL to canonical form for deduplication.
 
+    Results are memoized: the same URLs recur across dedup passes.
+
     Handles various input formats:
     - Full URLs: https://www.linkedin.com/in/johndoe
     - Short URLs: linkedin.com/in/johndoe
@@ -333,12 +454,26 @@ def normalize_linkedin(url: str | None) -> str:
     if not url:
         return ""
 
-    # Try to match full URL pattern
-    match = _LINKEDIN_PROFILE_RE.match(url)
-    if match:
-        profile_type = match.group(1).lower()  # "in" or "company"
-        username = match.group(2).lower().rstrip("/")
-        return f"linkedin.com/{profile_type}/{username}"
+    # Hand-coded scan of the full URL shape; the grammar is fixed and
+    # small, so plain string ops beat the regex engine here
+    lowered = url.lower()
+    for prefix in ("https://", "http://"):
+        if lowered.startswith(prefix):
+            lowered = lowered[len(prefix) :]
+            break
+    host, sep, path = lowered.partition("linkedin.com/")
+    if sep and _is_linkedin_host(host):
+        profile_type, _, rest = path.partition("/")
+        if profile_type in ("in", "company") and rest:
+            # Username runs until the next path, query, or fragment
+            end = len(rest)
+            for stop in "/?#":
+                pos = rest.find(stop)
+                if pos != -1 and pos < end:
+                    end = pos
+            username = rest[:end]
+            if username:
+                return f"linkedin.com/{profile_type}/{username}"
 
     # Check for "in/username" format
     if url.lower().startswith("in/"):
@@ -353,4 +488,4 @@ def normalize_linkedin(url: str | None) -> str:
             return f"linkedin.com/in/{url.lower()}"
 
     # Not a valid LinkedIn profile reference
-    return ""
\ No newline at end of file
+    return ""
@@ -617,6 +617,10 @@ class PaginatedContacts(BaseModel):
         total: Total number of contacts matching the query.
         limit: Maximum results per page.
         offset: Number of results skipped.
+        next_cursor: Opaque keyset cursor for the next page, when the API
+            provides one. Preferred over offset arithmetic: keyset pages
+            are O(page size) server-side and stable under concurrent
+            inserts, while OFFSET scans and discards ``offset`` rows.
 
     Example:
         >>> result = client.get_contacts(limit=10)
@@ -630,15 +634,21 @@ class PaginatedContacts(BaseModel):
     total: int = Field(ge=0)
     limit: int = Field(default=100, ge=1, le=1000)
     offset: int = Field(default=0, ge=0)
+    next_cursor: str | None = None
 
     @property
     def has_more(self) -> bool:
         """
         Determine whether additional results exist beyond the current page.
-        
+
+        A cursor from the API is authoritative when present; otherwise
+        falls back to offset/total arithmetic.
+
         Returns:
             `true` if there are more results after this page, `false` otherwise.
         """
+        if self.next_cursor is not None:
+            return True
         return self.offset + len(self.contacts) < self.total
 
 
@@ -650,6 +660,7 @@ class PaginatedReminders(BaseModel):
         total: Total number of reminders matching the query.
         limit: Maximum results per page.
         offset: Number of results skipped.
+        next_cursor: Opaque keyset cursor for the next page, when provided.
     """
 
     model_config = ConfigDict(strict=True)
@@ -658,15 +669,21 @@ class PaginatedReminders(BaseModel):
     total: int = Field(ge=0)
     limit: int = Field(default=100, ge=1, le=1000)
     offset: int = Field(default=0, ge=0)
+    next_cursor: str | None = None
 
     @property
     def has_more(self) -> bool:
         """
         Indicates whether pagination has additional results after the current page.
-        
+
+        A cursor from the API is authoritative when present; otherwise
+        falls back to offset/total arithmetic.
+
         Returns:
             `true` if there are more results beyond the current page, `false` otherwise.
         """
+        if self.next_cursor is not None:
+            return True
         return self.offset + len(self.reminders) < self.total
 
 
@@ -678,6 +695,7 @@ class PaginatedNotes(BaseModel):
         total: Total number of notes matching the query.
         limit: Maximum results per page.
         offset: Number of results skipped.
+        next_cursor: Opaque keyset cursor for the next page, when provided.
     """
 
     model_config = ConfigDict(strict=True)
@@ -686,15 +704,21 @@ class PaginatedNotes(BaseModel):
     total: int = Field(ge=0)
     limit: int = Field(default=100, ge=1, le=1000)
     offset: int = Field(default=0, ge=0)
+    next_cursor: str | None = None
 
     @property
     def has_more(self) -> bool:
         """
         Determines whether there are additional results beyond the current page.
-        
+
+        A cursor from the API is authoritative when present; otherwise
+        falls back to offset/total arithmetic.
+
         Returns:
             True if there are more results beyond the current page, False otherwise.
         """
+        if self.next_cursor is not None:
+            return True
         return self.offset + len(self.notes) < self.total
 
 
@@ -1,17 +1,54 @@
 """Pytest fixtures for Dex client tests."""
 
-from typing import Literal
+import asyncio
+from typing import Callable, Generator, Literal
 
 import pytest
 
 from dex_python import Settings
+from tests import helpers
 
 ClientKind = Literal["sync", "async"]
 
 
-@pytest.fixture
+def pytest_asyncio_loop_factories(
+    config: pytest.Config, item: pytest.Item
+) -> dict[str, Callable[[], asyncio.AbstractEventLoop]]:
+    """Run async tests on uvloop where available (not packaged for Windows)."""
+    try:
+        import uvloop
+    except ImportError:
+        return {"asyncio": asyncio.new_event_loop}
+    return {"uvloop": uvloop.new_event_loop}
+
+
+def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
+    """Shard sync/async parametrizations for pytest-xdist loadgroup runs.
+
+    Under ``pytest -n auto --dist loadgroup`` each client kind lands on
+    its own worker, so per-kind shared clients are built once per worker.
+    Serial runs ignore the marker.
+    """
+    for item in items:
+        callspec = getattr(item, "callspec", None)
+        if callspec is not None and "client_kind" in callspec.params:
+            item.add_marker(pytest.mark.xdist_group(callspec.params["client_kind"]))
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _close_shared_clients() -> Generator[None, None, None]:
+    """Close the clients cached by ``client_context`` at session end."""
+    yield
+    helpers.close_shared_clients()
+
+
+@pytest.fixture(scope="session")
 def settings() -> Settings:
-    """Create test settings."""
+    """Create test settings, validated once for the whole session.
+
+    Tests only read from this model; tests that need env-driven or
+    customized Settings (test_config.py) build their own instances.
+    """
     return Settings(
         dex_api_key="test-api-key",
         dex_base_url="https://api.getdex.com/api/rest",
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import inspect
 from contextlib import asynccontextmanager
 from typing import AsyncIterator, Literal
@@ -13,18 +14,49 @@ from dex_python.async_client import AsyncDexClient
 
 ClientKind = Literal["sync", "async"]
 
+# Clients are reused across tests keyed on (kind, api key, base URL) so the
+# suite pays httpx's client construction cost once per kind instead of once
+# per test. pytest-httpx patches the transport classes, so cached clients
+# still route through each test's own mock.
+_client_cache: dict[tuple[ClientKind, str, str], DexClient | AsyncDexClient] = {}
+
+
+def _shared_client(
+    client_kind: ClientKind, settings: Settings
+) -> DexClient | AsyncDexClient:
+    """Return the cached client for this kind/settings, creating it if needed."""
+    key = (client_kind, settings.dex_api_key, settings.dex_base_url)
+    client = _client_cache.get(key)
+    if client is None:
+        if client_kind == "sync":
+            client = DexClient(settings)
+        else:
+            client = AsyncDexClient(settings)
+        _client_cache[key] = client
+    return client
+
+
+def close_shared_clients() -> None:
+    """Close every cached client; called once at session teardown."""
+    for client in _client_cache.values():
+        if isinstance(client, DexClient):
+            client.close()
+        else:
+            asyncio.run(client.close())
+    _client_cache.clear()
+
 
 @asynccontextmanager
 async def client_context(
     client_kind: ClientKind, settings: Settings
 ) -> AsyncIterator[DexClient | AsyncDexClient]:
-    """Provide a client context manager based on kind."""
-    if client_kind == "sync":
-        with DexClient(settings) as client:
-            yield client
-    else:
-        async with AsyncDexClient(settings) as client:
-            yield client
+    """Provide a shared client for the requested kind.
+
+    The yielded client is cached for the whole session and is not closed
+    on exit; tests covering the close/context-manager protocol should
+    construct their own client.
+    """
+    yield _shared_client(client_kind, settings)
 
 
 async def maybe_await(value: object) -> object:
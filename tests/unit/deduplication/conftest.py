@@ -0,0 +1,139 @@
+"""Shared fixtures for deduplication tests.
+
+The test schema is built once per session in a template database; each
+test clones it with ``sqlite3.Connection.backup()``, which copies the
+already-parsed schema pages instead of re-running the DDL per test.
+"""
+
+import sqlite3
+from typing import Generator
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def schema_template() -> Generator[sqlite3.Connection, None, None]:
+    """Build the contacts/emails/phones schema once for the session."""
+    conn = sqlite3.connect(":memory:")
+    cursor = conn.cursor()
+
+    # Tables match the production schema
+    cursor.execute("""
+        CREATE TABLE contacts (
+            id TEXT PRIMARY KEY,
+            first_name TEXT,
+            last_name TEXT,
+            job_title TEXT,
+            linkedin TEXT,
+            website TEXT,
+            full_data JSON
+        )
+    """)
+
+    cursor.execute("""
+        CREATE TABLE emails (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            contact_id TEXT,
+            email TEXT,
+            FOREIGN KEY(contact_id) REFERENCES contacts(id)
+        )
+    """)
+
+    cursor.execute("""
+        CREATE TABLE phones (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            contact_id TEXT,
+            phone_number TEXT,
+            label TEXT,
+            FOREIGN KEY(contact_id) REFERENCES contacts(id)
+        )
+    """)
+
+    # Indexes matching production expectations, so queries exercised here
+    # run on the same plans as production instead of sequential scans
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_contacts_linkedin ON contacts(linkedin)"
+    )
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_contacts_last_name "
+        "ON contacts(last_name COLLATE NOCASE)"
+    )
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_emails_email ON emails(email COLLATE NOCASE)"
+    )
+    # Expression index matching find_email_duplicates' GROUP BY lower(email)
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_emails_email_lower ON emails(lower(email))"
+    )
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_phones_phone_number ON phones(phone_number)"
+    )
+    # Birthday matching groups on this JSON path; index the expression
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_contacts_birthday "
+        "ON contacts(json_extract(full_data, '$.birthday'))"
+    )
+    # contact_id indexes keep merge_cluster's reassignment UPDATEs on an
+    # index scan instead of a full table scan
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_emails_contact_id ON emails(contact_id)"
+    )
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_phones_contact_id ON phones(contact_id)"
+    )
+    conn.commit()
+
+    yield conn
+    conn.close()
+
+
+@pytest.fixture
+def db_connection(
+    schema_template: sqlite3.Connection,
+) -> Generator[sqlite3.Connection, None, None]:
+    """Fresh in-memory database cloned from the session template."""
+    # A larger statement cache keeps the repeated INSERT templates used
+    # across tests parsed between executions
+    conn = sqlite3.connect(":memory:", cached_statements=256)
+    schema_template.backup(conn)
+    # Skip journal and fsync work; durability is irrelevant for test DBs
+    conn.execute("PRAGMA journal_mode=MEMORY")
+    conn.execute("PRAGMA synchronous=OFF")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    yield conn
+    conn.close()
+
+
+@pytest.fixture
+def conn(
+    db_connection: sqlite3.Connection,
+) -> sqlite3.Connection:
+    """Alias for ``db_connection`` used by the normalization tests."""
+    return db_connection
+
+
+@pytest.fixture
+def big_db(
+    request: pytest.FixtureRequest,
+    db_connection: sqlite3.Connection,
+) -> sqlite3.Connection:
+    """Database with ``request.param`` synthetic contacts, ~10% duplicated.
+
+    Rows are bulk-inserted with one executemany so fixture cost stays
+    dominated by the code under test, not setup.
+    """
+    n_contacts = request.param
+    n_dupes = n_contacts // 10
+    rows = [
+        (
+            f"contact_{i}",
+            f"First{i % n_dupes if i < n_dupes * 2 else i}",
+            f"Last{i % n_dupes if i < n_dupes * 2 else i}",
+        )
+        for i in range(n_contacts)
+    ]
+    db_connection.executemany(
+        "INSERT INTO contacts (id, first_name, last_name) VALUES (?, ?, ?)", rows
+    )
+    db_connection.commit()
+    return db_connection
@@ -1,36 +1,10 @@
 """Tests for birthday-based duplicate detection."""
 
-import json
 import sqlite3
-from typing import Generator
-
-import pytest
 
 from dex_python.deduplication import find_birthday_name_duplicates
 
 
-@pytest.fixture
-def db_connection() -> Generator[sqlite3.Connection, None, None]:
-    """Create an in-memory SQLite database for testing."""
-    conn = sqlite3.connect(":memory:")
-    cursor = conn.cursor()
-
-    cursor.execute("""
-        CREATE TABLE contacts (
-            id TEXT PRIMARY KEY,
-            first_name TEXT,
-            last_name TEXT,
-            job_title TEXT,
-            linkedin TEXT,
-            website TEXT,
-            full_data JSON
-        )
-    """)
-
-    yield conn
-    conn.close()
-
-
 def insert_contact(
     cursor: sqlite3.Cursor,
     contact_id: str,
@@ -38,12 +12,18 @@ def insert_contact(
     last_name: str,
     birthday: str | None = None,
 ) -> None:
-    """Helper to insert a contact with optional birthday."""
-    full_data = {"birthday": birthday} if birthday else {}
+    """Helper to insert a contact with optional birthday.
+
+    The JSON blob is built by SQLite's json_object() rather than
+    json.dumps, skipping per-row Python serialization.
+    """
     cursor.execute(
         """INSERT INTO contacts (id, first_name, last_name, full_data)
-        VALUES (?, ?, ?, ?)""",
-        (contact_id, first_name, last_name, json.dumps(full_data)),
+        VALUES (?, ?, ?, CASE
+            WHEN ? IS NULL THEN json_object()
+            ELSE json_object('birthday', ?)
+        END)""",
+        (contact_id, first_name, last_name, birthday, birthday),
     )
 
 
@@ -50,3 +50,18 @@ def test_cluster_duplicates_complex() -> None:
     cluster_sets = [set(c) for c in clusters]
     assert {"A", "B", "C", "F"} in cluster_sets
     assert {"D", "E"} in cluster_sets
+
+
+def test_cluster_duplicates_large_chain() -> None:
+    """Test clustering many synthetic pairs stays fast and correct."""
+    # 10k pairs forming 1k chains of 10 contacts each
+    matches = [
+        {"contact_ids": [f"c{chain}-{i}", f"c{chain}-{i + 1}"]}
+        for chain in range(1000)
+        for i in range(10)
+    ]
+
+    clusters = cluster_duplicates(matches)
+
+    assert len(clusters) == 1000
+    assert all(len(c) == 11 for c in clusters)
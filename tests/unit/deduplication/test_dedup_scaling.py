@@ -0,0 +1,48 @@
+"""Scaling regression tests for the deduplication detectors.
+
+The functional tests only cover a handful of rows, which would let a
+quadratic regression slip through unnoticed. These tests run the
+detectors against 10k/100k synthetic contacts and gate on wall-clock
+bounds generous enough for slow CI machines but far below what an O(N²)
+implementation would need.
+
+Marked ``slow`` and skipped by default; run with ``pytest -m slow``.
+"""
+
+import sqlite3
+import time
+
+import pytest
+
+from dex_python.deduplication import (
+    cluster_duplicates,
+    find_fingerprint_name_duplicates,
+)
+
+pytestmark = pytest.mark.slow
+
+
+@pytest.mark.parametrize("big_db", [10_000, 100_000], indirect=True)
+def test_fingerprint_name_duplicates_scales(big_db: sqlite3.Connection) -> None:
+    """Fingerprint matching must stay near-linear in contact count."""
+    start = time.perf_counter()
+    results = find_fingerprint_name_duplicates(big_db)
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < 2.0, f"Fingerprint matching took {elapsed:.2f}s (expected < 2s)"
+    assert len(results) > 0
+
+
+@pytest.mark.parametrize("n_pairs", [10_000, 100_000])
+def test_cluster_duplicates_scales(n_pairs: int) -> None:
+    """Union-find clustering must stay near-linear in match count."""
+    matches = [
+        {"contact_ids": [f"c{i}", f"c{i + 1}"]} for i in range(n_pairs)
+    ]
+
+    start = time.perf_counter()
+    clusters = cluster_duplicates(matches)
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < 2.0, f"Clustering took {elapsed:.2f}s (expected < 2s)"
+    assert len(clusters) == 1
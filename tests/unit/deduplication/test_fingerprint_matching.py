@@ -3,31 +3,6 @@
 TDD tests for finding duplicates using OpenRefine-style fingerprints.
 """
 
-import sqlite3
-
-import pytest
-
-
-@pytest.fixture
-def conn():
-    """Create in-memory SQLite database with test schema."""
-    conn = sqlite3.connect(":memory:")
-    cursor = conn.cursor()
-    cursor.execute("""
-        CREATE TABLE contacts (
-            id TEXT PRIMARY KEY,
-            first_name TEXT,
-            last_name TEXT,
-            job_title TEXT,
-            linkedin TEXT,
-            website TEXT,
-            full_data TEXT
-        )
-    """)
-    conn.commit()
-    return conn
-
-
 class TestFingerprintNameDuplicates:
     """Test fingerprint-based name duplicate detection."""
 
@@ -1,55 +1,10 @@
 """Tests for Level 1 (Deterministic) duplicate detection."""
 
 import sqlite3
-from typing import Generator
-
-import pytest
 
 from dex_python.deduplication import find_email_duplicates, find_phone_duplicates
 
 
-@pytest.fixture
-def db_connection() -> Generator[sqlite3.Connection, None, None]:
-    """Create an in-memory SQLite database for testing."""
-    conn = sqlite3.connect(":memory:")
-    cursor = conn.cursor()
-
-    # Create tables matching the production schema
-    cursor.execute("""
-        CREATE TABLE contacts (
-            id TEXT PRIMARY KEY,
-            first_name TEXT,
-            last_name TEXT,
-            job_title TEXT,
-            linkedin TEXT,
-            website TEXT,
-            full_data JSON
-        )
-    """)
-
-    cursor.execute("""
-        CREATE TABLE emails (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            contact_id TEXT,
-            email TEXT,
-            FOREIGN KEY(contact_id) REFERENCES contacts(id)
-        )
-    """)
-
-    cursor.execute("""
-        CREATE TABLE phones (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            contact_id TEXT,
-            phone_number TEXT,
-            label TEXT,
-            FOREIGN KEY(contact_id) REFERENCES contacts(id)
-        )
-    """)
-
-    yield conn
-    conn.close()
-
-
 def test_find_email_duplicates_none(db_connection: sqlite3.Connection) -> None:
     """Test finding duplicates when there are none."""
     cursor = db_connection.cursor()
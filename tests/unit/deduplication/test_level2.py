@@ -2,31 +2,9 @@
 
 import sqlite3
 
-import pytest
-
 from dex_python.deduplication import find_name_and_title_duplicates
 
 
-@pytest.fixture
-def db_connection() -> sqlite3.Connection:
-    """Create an in-memory SQLite database for testing."""
-    conn = sqlite3.connect(":memory:")
-    cursor = conn.cursor()
-
-    cursor.execute("""
-        CREATE TABLE contacts (
-            id TEXT PRIMARY KEY,
-            first_name TEXT,
-            last_name TEXT,
-            job_title TEXT,
-            linkedin TEXT,
-            website TEXT,
-            full_data JSON
-        )
-    """)
-    return conn
-
-
 def test_find_name_title_duplicates_none(db_connection: sqlite3.Connection) -> None:
     """Test finding duplicates when there are none."""
     cursor = db_connection.cursor()
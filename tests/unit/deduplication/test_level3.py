@@ -2,31 +2,9 @@
 
 import sqlite3
 
-import pytest
-
 from dex_python.deduplication import find_fuzzy_name_duplicates
 
 
-@pytest.fixture
-def db_connection() -> sqlite3.Connection:
-    """Create an in-memory SQLite database for testing."""
-    conn = sqlite3.connect(":memory:")
-    cursor = conn.cursor()
-
-    cursor.execute("""
-        CREATE TABLE contacts (
-            id TEXT PRIMARY KEY,
-            first_name TEXT,
-            last_name TEXT,
-            job_title TEXT,
-            linkedin TEXT,
-            website TEXT,
-            full_data JSON
-        )
-    """)
-    return conn
-
-
 def test_find_fuzzy_name_duplicates_typo(db_connection: sqlite3.Connection) -> None:
     """Test finding duplicates with slight typos (Levenshtein/Jaro-Winkler)."""
     cursor = db_connection.cursor()
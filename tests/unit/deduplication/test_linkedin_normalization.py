@@ -3,36 +3,6 @@
 TDD tests for finding duplicate contacts by LinkedIn profile URL.
 """
 
-import sqlite3
-
-import pytest
-
-
-@pytest.fixture
-def conn():
-    """
-    Create an in-memory SQLite database initialized with the test contacts schema and index.
-    
-    Returns:
-        sqlite3.Connection: Connection to the in-memory database with the `contacts` table and `idx_contacts_linkedin` index already created and committed.
-    """
-    conn = sqlite3.connect(":memory:")
-    cursor = conn.cursor()
-    cursor.execute("""
-        CREATE TABLE contacts (
-            id TEXT PRIMARY KEY,
-            first_name TEXT,
-            last_name TEXT,
-            linkedin TEXT
-        )
-    """)
-    cursor.execute(
-        "CREATE INDEX IF NOT EXISTS idx_contacts_linkedin ON contacts(linkedin)"
-    )
-    conn.commit()
-    return conn
-
-
 class TestLinkedInDuplicates:
     """Test LinkedIn duplicate detection with URL normalization."""
 
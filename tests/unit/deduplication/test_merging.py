@@ -2,46 +2,9 @@
 
 import sqlite3
 
-import pytest
-
 from dex_python.deduplication import merge_cluster
 
 
-@pytest.fixture
-def db_connection() -> sqlite3.Connection:
-    """Create an in-memory SQLite database for testing."""
-    conn = sqlite3.connect(":memory:")
-    cursor = conn.cursor()
-
-    cursor.execute("""
-        CREATE TABLE contacts (
-            id TEXT PRIMARY KEY,
-            first_name TEXT,
-            last_name TEXT,
-            job_title TEXT,
-            linkedin TEXT,
-            website TEXT,
-            full_data JSON
-        )
-    """)
-    cursor.execute("""
-        CREATE TABLE emails (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            contact_id TEXT,
-            email TEXT
-        )
-    """)
-    cursor.execute("""
-        CREATE TABLE phones (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            contact_id TEXT,
-            phone_number TEXT,
-            label TEXT
-        )
-    """)
-    return conn
-
-
 def test_merge_cluster_basic(db_connection: sqlite3.Connection) -> None:
     """Test merging two contacts into one."""
     cursor = db_connection.cursor()
@@ -3,38 +3,6 @@
 TDD tests for finding phone duplicates with normalized phone numbers.
 """
 
-import sqlite3
-
-import pytest
-
-
-@pytest.fixture
-def conn():
-    """Create in-memory SQLite database with test schema."""
-    conn = sqlite3.connect(":memory:")
-    cursor = conn.cursor()
-    cursor.execute("""
-        CREATE TABLE contacts (
-            id TEXT PRIMARY KEY,
-            first_name TEXT,
-            last_name TEXT,
-            job_title TEXT,
-            linkedin TEXT,
-            website TEXT,
-            full_data TEXT
-        )
-    """)
-    cursor.execute("""
-        CREATE TABLE phones (
-            id INTEGER PRIMARY KEY,
-            contact_id TEXT,
-            phone_number TEXT
-        )
-    """)
-    conn.commit()
-    return conn
-
-
 class TestPhoneNormalization:
     """Test phone duplicate detection with normalization."""
 
@@ -8,14 +8,29 @@ from dex_python.async_client import AsyncDexClient
 from dex_python.exceptions import AuthenticationError, DexAPIError
 
 
+def capture_sleep(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    """Replace the retry loop's asyncio.sleep with a no-op that records delays."""
+    delays: list[float] = []
+
+    async def fake_sleep(delay: float) -> None:
+        delays.append(delay)
+
+    monkeypatch.setattr("dex_python.async_client.asyncio.sleep", fake_sleep)
+    return delays
+
+
 class TestAsyncRetryLogic:
     """Test suite for async retry behavior."""
 
     @pytest.mark.asyncio
     async def test_retry_on_503(
-        self, settings: Settings, httpx_mock: HTTPXMock
+        self,
+        settings: Settings,
+        httpx_mock: HTTPXMock,
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         """Test retry on 503 Service Unavailable."""
+        delays = capture_sleep(monkeypatch)
         httpx_mock.add_response(
             url="https://api.getdex.com/api/rest/contacts?limit=100&offset=0",
             status_code=503,
@@ -29,12 +44,17 @@ class TestAsyncRetryLogic:
             contacts = await client.get_contacts()
 
         assert len(contacts) == 1
+        assert delays == [0.01]
 
     @pytest.mark.asyncio
     async def test_retry_on_429(
-        self, settings: Settings, httpx_mock: HTTPXMock
+        self,
+        settings: Settings,
+        httpx_mock: HTTPXMock,
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         """Test retry on 429 Too Many Requests."""
+        delays = capture_sleep(monkeypatch)
         httpx_mock.add_response(
             url="https://api.getdex.com/api/rest/contacts?limit=100&offset=0",
             status_code=429,
@@ -48,12 +68,17 @@ class TestAsyncRetryLogic:
             contacts = await client.get_contacts()
 
         assert len(contacts) == 1
+        assert delays == [0.01]
 
     @pytest.mark.asyncio
     async def test_max_retries_exceeded(
-        self, settings: Settings, httpx_mock: HTTPXMock
+        self,
+        settings: Settings,
+        httpx_mock: HTTPXMock,
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         """Test that error is raised after max retries exceeded."""
+        delays = capture_sleep(monkeypatch)
         httpx_mock.add_response(
             url="https://api.getdex.com/api/rest/contacts?limit=100&offset=0",
             status_code=503,
@@ -73,11 +98,17 @@ class TestAsyncRetryLogic:
             ) as client:
                 await client.get_contacts()
 
+        assert delays == [0.01, 0.02]
+
     @pytest.mark.asyncio
     async def test_no_retry_on_401(
-        self, settings: Settings, httpx_mock: HTTPXMock
+        self,
+        settings: Settings,
+        httpx_mock: HTTPXMock,
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         """Test that 401 errors are not retried."""
+        delays = capture_sleep(monkeypatch)
         httpx_mock.add_response(
             url="https://api.getdex.com/api/rest/contacts?limit=100&offset=0",
             status_code=401,
@@ -90,11 +121,17 @@ class TestAsyncRetryLogic:
             ) as client:
                 await client.get_contacts()
 
+        assert delays == []
+
     @pytest.mark.asyncio
     async def test_default_no_retries(
-        self, settings: Settings, httpx_mock: HTTPXMock
+        self,
+        settings: Settings,
+        httpx_mock: HTTPXMock,
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         """Test that default client has no retries."""
+        delays = capture_sleep(monkeypatch)
         httpx_mock.add_response(
             url="https://api.getdex.com/api/rest/contacts?limit=100&offset=0",
             status_code=503,
@@ -103,3 +140,5 @@ class TestAsyncRetryLogic:
         with pytest.raises(DexAPIError):
             async with AsyncDexClient(settings) as client:
                 await client.get_contacts()
+
+        assert delays == []
@@ -2,8 +2,7 @@
 
 from __future__ import annotations
 
-import json
-
+import orjson
 import pytest
 from pytest_httpx import HTTPXMock
 
@@ -33,6 +32,39 @@ from tests.helpers import (
 
 pytestmark = pytest.mark.asyncio
 
+# Mock payloads shared by the GET tests: encoded once at import instead
+# of once per sync/async parametrization
+_CONTACTS_PAGE = {
+    "contacts": [
+        {"id": "1", "first_name": "John", "last_name": "Doe"},
+        {"id": "2", "first_name": "Jane", "last_name": "Smith"},
+    ],
+    "pagination": {"total": {"count": 2}},
+}
+_CONTACTS_PAGE_BODY = orjson.dumps(_CONTACTS_PAGE)
+
+_CONTACT_BY_ID = {
+    "contacts": [
+        {
+            "id": "123",
+            "first_name": "John",
+            "emails": [{"email": "john@example.com"}],
+        }
+    ]
+}
+_CONTACT_BY_ID_BODY = orjson.dumps(_CONTACT_BY_ID)
+
+_CONTACT_BY_EMAIL = {
+    "search_contacts_by_exact_email": [
+        {
+            "id": "456",
+            "first_name": "Jane",
+            "emails": [{"email": "jane@example.com"}],
+        }
+    ]
+}
+_CONTACT_BY_EMAIL_BODY = orjson.dumps(_CONTACT_BY_EMAIL)
+
 
 async def test_client_uses_correct_headers(
     client_kind: ClientKind, settings: Settings
@@ -46,16 +78,9 @@ async def test_client_uses_correct_headers(
 async def test_get_contacts(
     client_kind: ClientKind, settings: Settings, httpx_mock: HTTPXMock
 ) -> None:
-    mock_response = {
-        "contacts": [
-            {"id": "1", "first_name": "John", "last_name": "Doe"},
-            {"id": "2", "first_name": "Jane", "last_name": "Smith"},
-        ],
-        "pagination": {"total": {"count": 2}},
-    }
     httpx_mock.add_response(
         url=build_url(settings, "/contacts", "limit=100&offset=0"),
-        json=mock_response,
+        content=_CONTACTS_PAGE_BODY,
     )
 
     async with client_context(client_kind, settings) as client:
@@ -68,18 +93,9 @@ async def test_get_contacts(
 async def test_get_contact_by_id(
     client_kind: ClientKind, settings: Settings, httpx_mock: HTTPXMock
 ) -> None:
-    mock_response = {
-        "contacts": [
-            {
-                "id": "123",
-                "first_name": "John",
-                "emails": [{"email": "john@example.com"}],
-            }
-        ]
-    }
     httpx_mock.add_response(
         url=build_url(settings, "/contacts/123"),
-        json=mock_response,
+        content=_CONTACT_BY_ID_BODY,
     )
 
     async with client_context(client_kind, settings) as client:
@@ -92,18 +108,9 @@ async def test_get_contact_by_id(
 async def test_get_contact_by_email(
     client_kind: ClientKind, settings: Settings, httpx_mock: HTTPXMock
 ) -> None:
-    mock_response = {
-        "search_contacts_by_exact_email": [
-            {
-                "id": "456",
-                "first_name": "Jane",
-                "emails": [{"email": "jane@example.com"}],
-            }
-        ]
-    }
     httpx_mock.add_response(
         url=build_url(settings, "/search/contacts", "email=jane%40example.com"),
-        json=mock_response,
+        content=_CONTACT_BY_EMAIL_BODY,
     )
 
     async with client_context(client_kind, settings) as client:
@@ -136,78 +143,71 @@ async def test_create_contact_sends_expected_body(
     request = get_single_request(httpx_mock)
     assert request.method == "POST"
     assert str(request.url) == build_url(settings, "/contacts")
-    assert json.loads(request.content) == {
+    assert orjson.loads(request.content) == {
         "contact": new_contact.model_dump(exclude_none=True)
     }
     assert result["id"] == "789"
 
 
-async def test_update_contact_sends_expected_body(
-    client_kind: ClientKind, settings: Settings, httpx_mock: HTTPXMock
-) -> None:
-    update = ContactUpdate(contact_id="contact-123", changes={"first_name": "New"})
-    mock_response = {"update_contacts_by_pk": {"id": "contact-123"}}
-    httpx_mock.add_response(
-        url=build_url(settings, "/contacts/contact-123"),
-        method="PUT",
-        json=mock_response,
-    )
-
-    async with client_context(client_kind, settings) as client:
-        result = await maybe_await(client.update_contact(update))
-
-    request = get_single_request(httpx_mock)
-    assert request.method == "PUT"
-    assert str(request.url) == build_url(settings, "/contacts/contact-123")
-    assert json.loads(request.content) == update.model_dump(
-        exclude_none=True, by_alias=True
-    )
-    assert result["id"] == "contact-123"
-
-
-async def test_update_reminder_sends_expected_body(
-    client_kind: ClientKind, settings: Settings, httpx_mock: HTTPXMock
+@pytest.mark.parametrize(
+    "method_name, update, path, by_alias, response_key, entity_id",
+    [
+        (
+            "update_contact",
+            ContactUpdate(contact_id="contact-123", changes={"first_name": "New"}),
+            "/contacts/contact-123",
+            True,
+            "update_contacts_by_pk",
+            "contact-123",
+        ),
+        (
+            "update_reminder",
+            ReminderUpdate(
+                reminder_id="reminder-123",
+                changes={"text": "Updated text", "is_complete": True},
+            ),
+            "/reminders/reminder-123",
+            False,
+            "update_reminders_by_pk",
+            "reminder-123",
+        ),
+        (
+            "update_note",
+            NoteUpdate(note_id="note-456", changes={"note": "Updated note"}),
+            "/timeline_items/note-456",
+            False,
+            "update_timeline_items_by_pk",
+            "note-456",
+        ),
+    ],
+)
+async def test_update_sends_expected_body(
+    client_kind: ClientKind,
+    settings: Settings,
+    httpx_mock: HTTPXMock,
+    method_name: str,
+    update: ContactUpdate | ReminderUpdate | NoteUpdate,
+    path: str,
+    by_alias: bool,
+    response_key: str,
+    entity_id: str,
 ) -> None:
-    update = ReminderUpdate(
-        reminder_id="reminder-123",
-        changes={"text": "Updated text", "is_complete": True},
-    )
-    mock_response = {"update_reminders_by_pk": {"id": "reminder-123"}}
     httpx_mock.add_response(
-        url=build_url(settings, "/reminders/reminder-123"),
+        url=build_url(settings, path),
         method="PUT",
-        json=mock_response,
+        json={response_key: {"id": entity_id}},
     )
 
     async with client_context(client_kind, settings) as client:
-        result = await maybe_await(client.update_reminder(update))
+        result = await maybe_await(getattr(client, method_name)(update))
 
     request = get_single_request(httpx_mock)
     assert request.method == "PUT"
-    assert str(request.url) == build_url(settings, "/reminders/reminder-123")
-    assert json.loads(request.content) == update.model_dump(exclude_none=True)
-    assert result["id"] == "reminder-123"
-
-
-async def test_update_note_sends_expected_body(
-    client_kind: ClientKind, settings: Settings, httpx_mock: HTTPXMock
-) -> None:
-    update = NoteUpdate(note_id="note-456", changes={"note": "Updated note"})
-    mock_response = {"update_timeline_items_by_pk": {"id": "note-456"}}
-    httpx_mock.add_response(
-        url=build_url(settings, "/timeline_items/note-456"),
-        method="PUT",
-        json=mock_response,
+    assert str(request.url) == build_url(settings, path)
+    assert orjson.loads(request.content) == update.model_dump(
+        exclude_none=True, by_alias=by_alias
     )
-
-    async with client_context(client_kind, settings) as client:
-        result = await maybe_await(client.update_note(update))
-
-    request = get_single_request(httpx_mock)
-    assert request.method == "PUT"
-    assert str(request.url) == build_url(settings, "/timeline_items/note-456")
-    assert json.loads(request.content) == update.model_dump(exclude_none=True)
-    assert result["id"] == "note-456"
+    assert result["id"] == entity_id
 
 
 async def test_delete_contact(
@@ -231,26 +231,18 @@ async def test_delete_contact(
 async def test_context_manager_closes_client(
     client_kind: ClientKind, settings: Settings
 ) -> None:
+    # Uses a dedicated client: the shared client_context one stays open
+    # for reuse across tests.
     client_ref: DexClient | AsyncDexClient
-    async with client_context(client_kind, settings) as client:
-        client_ref = client
+    if client_kind == "sync":
+        with DexClient(settings) as client_ref:
+            pass
+    else:
+        async with AsyncDexClient(settings) as client_ref:
+            pass
     assert client_ref._client.is_closed
 
 
-async def test_401_raises_authentication_error(
-    client_kind: ClientKind, settings: Settings, httpx_mock: HTTPXMock
-) -> None:
-    httpx_mock.add_response(
-        url=build_url(settings, "/contacts", "limit=100&offset=0"),
-        status_code=401,
-        json={"error": "Invalid API key"},
-    )
-
-    async with client_context(client_kind, settings) as client:
-        with pytest.raises(AuthenticationError):
-            await maybe_await(client.get_contacts())
-
-
 async def test_404_raises_contact_not_found(
     client_kind: ClientKind, settings: Settings, httpx_mock: HTTPXMock
 ) -> None:
@@ -268,6 +260,7 @@ async def test_404_raises_contact_not_found(
 @pytest.mark.parametrize(
     "status_code, error_json, expected_exception",
     [
+        (401, {"error": "Invalid API key"}, AuthenticationError),
         (429, {"error": "Rate limit exceeded"}, RateLimitError),
         (500, {"error": "Internal server error"}, DexAPIError),
     ],
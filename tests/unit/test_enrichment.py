@@ -1,5 +1,8 @@
 """Tests for job title parsing and enrichment."""
 
+import re
+
+from dex_python import enrichment
 from dex_python.enrichment import parse_job_title
 
 
@@ -73,3 +76,7 @@ class TestParseJobTitle:
         result = parse_job_title("VP, Sales & Marketing at Johnson & Johnson")
         assert result["role"] == "VP, Sales & Marketing"
         assert result["company"] == "Johnson & Johnson"
+
+    def test_uses_compiled_pattern(self) -> None:
+        """Separator pattern is compiled once at module scope for bulk use."""
+        assert isinstance(enrichment._JOB_TITLE_SEPARATOR_RE, re.Pattern)
@@ -1,5 +1,8 @@
 """Tests for custom exceptions."""
 
+import httpx
+import pytest
+
 from dex_python.exceptions import (
     AuthenticationError,
     ContactNotFoundError,
@@ -8,6 +11,7 @@ from dex_python.exceptions import (
     RateLimitError,
     ReminderNotFoundError,
     ValidationError,
+    handle_error_response,
 )
 
 
@@ -48,23 +52,21 @@ class TestAuthenticationError:
 class TestNotFoundErrors:
     """Test suite for NotFound errors."""
 
-    def test_contact_not_found(self) -> None:
-        """Test ContactNotFoundError."""
-        error = ContactNotFoundError("contact-123")
-        assert isinstance(error, DexAPIError)
-        assert "contact-123" in str(error)
-
-    def test_reminder_not_found(self) -> None:
-        """Test ReminderNotFoundError."""
-        error = ReminderNotFoundError("reminder-456")
-        assert isinstance(error, DexAPIError)
-        assert "reminder-456" in str(error)
-
-    def test_note_not_found(self) -> None:
-        """Test NoteNotFoundError."""
-        error = NoteNotFoundError("note-789")
+    @pytest.mark.parametrize(
+        "error_class, entity_id",
+        [
+            (ContactNotFoundError, "contact-123"),
+            (ReminderNotFoundError, "reminder-456"),
+            (NoteNotFoundError, "note-789"),
+        ],
+    )
+    def test_not_found_error(
+        self, error_class: type[DexAPIError], entity_id: str
+    ) -> None:
+        """Test that NotFound errors embed the entity id."""
+        error = error_class(entity_id)
         assert isinstance(error, DexAPIError)
-        assert "note-789" in str(error)
+        assert entity_id in str(error)
 
 
 class TestRateLimitError:
@@ -88,3 +90,70 @@ class TestValidationError:
         """Test validation error."""
         error = ValidationError("Invalid email format")
         assert isinstance(error, DexAPIError)
+
+
+# Built once at import: handle_error_response only reads these, so the
+# same Response instances are safe to reuse across tests
+_ERROR_RESPONSES = {
+    status_code: httpx.Response(status_code, json={"error": "boom"})
+    for status_code in (400, 401, 404, 429, 500)
+}
+_RESP_429_RETRY_AFTER = httpx.Response(
+    429, headers={"Retry-After": "60"}, json={"error": "slow down"}
+)
+
+
+class TestHandleErrorResponse:
+    """Test suite for the shared status-code dispatch."""
+
+    @pytest.mark.parametrize(
+        "status_code, expected_exception",
+        [
+            (400, ValidationError),
+            (401, AuthenticationError),
+            (429, RateLimitError),
+            (500, DexAPIError),
+        ],
+    )
+    def test_status_code_dispatch(
+        self, status_code: int, expected_exception: type[DexAPIError]
+    ) -> None:
+        """Each mapped status raises its dedicated exception type."""
+        with pytest.raises(expected_exception):
+            handle_error_response(_ERROR_RESPONSES[status_code], "/contacts")
+
+    @pytest.mark.parametrize(
+        "endpoint, expected_exception, id_attr, id_value",
+        [
+            ("/contacts/abc123", ContactNotFoundError, "contact_id", "abc123"),
+            ("/reminders/xyz789", ReminderNotFoundError, "reminder_id", "xyz789"),
+            ("/timeline_items/note456", NoteNotFoundError, "note_id", "note456"),
+            # /contacts/ takes priority inside nested endpoints like
+            # get_notes_by_contact's /timeline_items/contacts/{id}
+            (
+                "/timeline_items/contacts/abc123",
+                ContactNotFoundError,
+                "contact_id",
+                "abc123",
+            ),
+            ("/some/other/endpoint", DexAPIError, None, None),
+        ],
+    )
+    def test_404_dispatch_by_endpoint(
+        self,
+        endpoint: str,
+        expected_exception: type[DexAPIError],
+        id_attr: str | None,
+        id_value: str | None,
+    ) -> None:
+        """404 responses map to the entity-specific NotFound error."""
+        with pytest.raises(expected_exception) as exc_info:
+            handle_error_response(_ERROR_RESPONSES[404], endpoint)
+        if id_attr is not None:
+            assert getattr(exc_info.value, id_attr) == id_value
+
+    def test_rate_limit_reads_retry_after(self) -> None:
+        """Retry-After header is surfaced on RateLimitError."""
+        with pytest.raises(RateLimitError) as exc_info:
+            handle_error_response(_RESP_429_RETRY_AFTER, "/contacts")
+        assert exc_info.value.retry_after == 60
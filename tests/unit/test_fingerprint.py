@@ -239,6 +239,43 @@ class TestEnsembleSimilarity:
         assert score_jw != score_lev
 
 
+class TestEnsembleSimilarityMatrix:
+    """Test batched ensemble similarity scoring."""
+
+    def test_matrix_shape(self):
+        """Result has one row per query and one column per choice."""
+        from dex_python.fingerprint import ensemble_similarity_matrix
+
+        scores = ensemble_similarity_matrix(["a", "b", "c"], ["x", "y"])
+        assert scores.shape == (3, 2)
+
+    def test_matches_scalar_scores(self):
+        """Each cell agrees with the pairwise ensemble_similarity."""
+        from dex_python.fingerprint import (
+            ensemble_similarity,
+            ensemble_similarity_matrix,
+        )
+
+        queries = ["Jonathan", "Alice"]
+        choices = ["Jonathon", "Zebra", "Alicia"]
+        scores = ensemble_similarity_matrix(queries, choices)
+        for i, q in enumerate(queries):
+            for j, c in enumerate(choices):
+                assert abs(scores[i, j] - ensemble_similarity(q, c)) < 1e-6
+
+    def test_custom_weights(self):
+        """Custom weights change the blended scores."""
+        from dex_python.fingerprint import ensemble_similarity_matrix
+
+        jw_only = ensemble_similarity_matrix(
+            ["test"], ["tset"], jw_weight=1.0, lev_weight=0.0
+        )
+        lev_only = ensemble_similarity_matrix(
+            ["test"], ["tset"], jw_weight=0.0, lev_weight=1.0
+        )
+        assert jw_only[0, 0] != lev_only[0, 0]
+
+
 class TestNormalizePhoneE164:
     """Test phone normalization with international E.164 support."""
 
@@ -2,19 +2,40 @@
 
 import json
 import sqlite3
+from collections.abc import Generator
 
-from scripts.main import init_db, insert_contact_data
+import pytest
 
+from scripts.main import init_db, insert_contact_data, insert_contacts
 
-def test_init_db_creates_name_columns() -> None:
-    """Ensure name parsing columns exist in the full sync schema."""
+
+@pytest.fixture(scope="session")
+def schema_conn() -> Generator[sqlite3.Connection, None, None]:
+    """One in-memory database with the full sync schema per session.
+
+    init_db runs the CREATE TABLE DDL for every sync table, which
+    dominates these tests; building the schema once amortizes it.
+    """
     conn = sqlite3.connect(":memory:")
-    cursor = conn.cursor()
+    init_db(conn.cursor())
+    conn.commit()
+    yield conn
+    conn.close()
 
-    init_db(cursor)
 
-    cursor.execute("PRAGMA table_info(contacts)")
-    columns = {row[1] for row in cursor.fetchall()}
+@pytest.fixture
+def cursor(schema_conn: sqlite3.Connection) -> Generator[sqlite3.Cursor, None, None]:
+    """Savepoint-wrapped cursor; writes roll back after each test."""
+    schema_conn.execute("SAVEPOINT test_case")
+    yield schema_conn.cursor()
+    schema_conn.execute("ROLLBACK TO test_case")
+    schema_conn.execute("RELEASE test_case")
+
+
+def test_init_db_creates_name_columns(schema_conn: sqlite3.Connection) -> None:
+    """Ensure name parsing columns exist in the full sync schema."""
+    rows = schema_conn.execute("PRAGMA table_info(contacts)").fetchall()
+    columns = {row[1] for row in rows}
     expected = {
         "name_parse_type",
         "name_parsed",
@@ -29,19 +50,14 @@ def test_init_db_creates_name_columns() -> None:
     assert expected.issubset(columns)
 
 
-def test_insert_contact_data_stores_parsed_name() -> None:
+def test_insert_contact_data_stores_parsed_name(cursor: sqlite3.Cursor) -> None:
     """Insert contacts with parsed name fields."""
-    conn = sqlite3.connect(":memory:")
-    cursor = conn.cursor()
-    init_db(cursor)
-
     contact = {
         "id": "c1",
         "first_name": "Ada",
         "last_name": "Lovelace",
     }
     insert_contact_data(cursor, contact)
-    conn.commit()
 
     cursor.execute("""
         SELECT name_given, name_surname, name_parsed
@@ -53,3 +69,31 @@ def test_insert_contact_data_stores_parsed_name() -> None:
     assert row[1] == "Lovelace"
     parsed = json.loads(row[2])
     assert parsed["raw"] == "Ada Lovelace"
+
+
+def test_insert_contacts_batches_related_rows(cursor: sqlite3.Cursor) -> None:
+    """One insert_contacts call stores all contacts, emails, and phones."""
+    contacts = [
+        {
+            "id": "c1",
+            "first_name": "Ada",
+            "last_name": "Lovelace",
+            "emails": [{"email": "ada@example.com"}],
+            "phones": [{"phone_number": "555-0001", "label": "Work"}],
+        },
+        {
+            "id": "c2",
+            "first_name": "Grace",
+            "last_name": "Hopper",
+            "emails": [{"email": "grace@example.com"}, {"email": ""}],
+        },
+    ]
+    insert_contacts(cursor, contacts)
+
+    assert cursor.execute("SELECT COUNT(*) FROM contacts").fetchone()[0] == 2
+    # The blank email is skipped
+    assert cursor.execute("SELECT COUNT(*) FROM emails").fetchone()[0] == 2
+    row = cursor.execute(
+        "SELECT contact_id, phone_number, label FROM phones"
+    ).fetchone()
+    assert row == ("c1", "555-0001", "Work")
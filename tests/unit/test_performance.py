@@ -233,4 +233,36 @@ def test_combinations_vs_nested_loops():
     # combinations should be faster
     assert new_time <= old_time, (
         f"combinations ({new_time:.3f}s) should be <= nested loops ({old_time:.3f}s)"
-    )
\ No newline at end of file
+    )
+
+def test_fingerprint_name_duplicates_performance():
+    """Test that fingerprint matching scales linearly via blocking."""
+    from dex_python.deduplication import find_fingerprint_name_duplicates
+
+    conn = sqlite3.connect(":memory:")
+    cursor = conn.cursor()
+    cursor.execute("""
+        CREATE TABLE contacts (
+            id TEXT PRIMARY KEY,
+            first_name TEXT,
+            last_name TEXT
+        )
+    """)
+    # 1000 contacts that all share the same fingerprint
+    cursor.executemany(
+        "INSERT INTO contacts (id, first_name, last_name) VALUES (?, ?, ?)",
+        [(f"contact_{i}", "John", "Smith") for i in range(1000)],
+    )
+    conn.commit()
+
+    start = time.time()
+    results = find_fingerprint_name_duplicates(conn)
+    elapsed = time.time() - start
+
+    # Grouping by fingerprint should handle 1000 rows well under 100ms
+    assert elapsed < 0.1, (
+        f"Fingerprint matching took {elapsed:.3f}s (expected < 0.1s)"
+    )
+    assert len(results) == 1
+    assert len(results[0]["contact_ids"]) == 1000
+    conn.close()